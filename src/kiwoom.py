@@ -1,10 +1,17 @@
 import os
 import re
+import math
 import time
 import random
+import asyncio
+import collections
+import httpx
+import orjson
 import requests
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Optional, Tuple, List
+from requests.adapters import HTTPAdapter
+from datetime import date, datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, List
 
 from token_store import RedisTokenStore
 
@@ -21,7 +28,24 @@ ENDPOINT_MRKCOND = "/api/dostk/mrkcond"  # ka10086
 MAX_RETRIES = 8
 BASE_SLEEP = 0.6
 MAX_SLEEP = 15.0
+MAX_RETRY_AFTER = 60.0  # 서버 Retry-After 힌트 상한
 SUCCESS_SLEEP_SEC = 0.15  # 429 완화용(성공 시에도 약간 쉼)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+AUTH_FAIL_STATUS = (401, 403)  # 토큰 무효 → 프로세스 내 토큰 캐시 폐기
+RECENT_429_WINDOW = 32  # 최근 응답 중 429 비율 추적 구간
+
+# ====== 캐시 ======
+STKLIST_CACHE_TTL = 6 * 60 * 60  # ka10099 종목 리스트 (6h)
+BASIC_CACHE_TTL = 24 * 60 * 60  # ka10001 기본정보 (1d)
+TOKEN_LOCAL_MARGIN = 60  # 프로세스 내 토큰 캐시: 만료 N초 전부터 Redis 재조회
+
+# ====== 비동기 수집 파라미터 ======
+ASYNC_CONCURRENCY = 16
+ASYNC_MAX_CONNECTIONS = 32
+ASYNC_MAX_KEEPALIVE = 16
+ASYNC_BATCH_SIZE = 500  # 수집 중 DB로 넘기는 row 배치 크기
+TR_RATE_PER_SEC = 5.0  # api-id별 초당 허용 요청 수
+TR_BURST = 5  # api-id별 순간 허용 버스트
 
 
 def ttl_from_expires_dt(expires_dt: str, safety_margin: int = 30) -> int:
@@ -35,15 +59,32 @@ def ttl_from_expires_dt(expires_dt: str, safety_margin: int = 30) -> int:
     return max(60, ttl)
 
 
+def _today_kst() -> str:
+    return datetime.now(KST).strftime("%Y%m%d")
+
+
 def _normalize_int(x: Any) -> int:
-    if x is None:
+    # 빠른 경로: int / 콤마·공백 없는 숫자 문자열 (키움 응답 대부분)
+    if x is None or x == "":
         return 0
-    if isinstance(x, (int, float)):
+    t = type(x)
+    if t is int:
+        return x
+    if t is str:
+        s = x
+    elif isinstance(x, (int, float)):
         return int(x)
-    s = str(x).replace(",", "").strip()
-    if s == "":
-        return 0
-    return int(float(s))
+    else:
+        s = str(x)
+    if "," in s:
+        s = s.replace(",", "")
+    try:
+        return int(s)
+    except ValueError:
+        s = s.strip()
+        if s == "":
+            return 0
+        return int(float(s))
 
 
 ETF_BRANDS = [
@@ -67,29 +108,25 @@ NON_STOCK_REGEX = re.compile(r"(?:\b[23]X\b|레버리지|인버스|선물|커버
 KR_CODE_REGEX = re.compile(r"^\d{6}$")
 
 
-def is_non_common_stock(name: str, company_class: str = "") -> bool:
-    n = (name or "").upper()
-    c = (company_class or "").upper()
+# 브랜드/토큰/정규식 컷을 하나의 패턴으로 합쳐 종목당 1회 검색
+_BLOCK_RE = re.compile(
+    "|".join(re.escape(t.upper()) for t in ETF_BRANDS + NON_STOCK_TOKENS)
+    + "|" + PREFERRED_REGEX.pattern
+    + "|" + NON_STOCK_REGEX.pattern,
+    re.IGNORECASE,
+)
+_CLASS_TOKENS = frozenset(["스팩", "SPAC", "리츠", "REIT", "ETF", "ETN"])
 
-    # 우선주 컷
-    if PREFERRED_REGEX.search(n):
-        return True
 
-    # 회사분류 힌트 컷
-    if any(x in c for x in ["스팩", "SPAC", "리츠", "REIT", "ETF", "ETN"]):
-        return True
-
-    # 브랜드 컷
-    if any(b in n for b in ETF_BRANDS):
-        return True
-
-    # 토큰 컷
-    if any(t.upper() in n for t in NON_STOCK_TOKENS):
+def is_non_common_stock(name: str, company_class: str = "") -> bool:
+    # 우선주/브랜드/토큰/정규식 컷
+    if name and _BLOCK_RE.search(name):
         return True
 
-    # 정규식 컷
-    if NON_STOCK_REGEX.search(n):
-        return True
+    # 회사분류 힌트 컷
+    if company_class:
+        c = company_class.upper()
+        return any(x in c for x in _CLASS_TOKENS)
 
     return False
 
@@ -100,20 +137,37 @@ def filter_stock_list(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     - 6자리 코드만
     - ETF/ETN/리츠/스팩/우선주/파생 등 제외
     """
-    out: List[Dict[str, Any]] = []
-    for item in items:
-        code = str(item.get("code", "")).strip()
-        name = str(item.get("name", "")).strip()
-        company_class = str(item.get("companyClassName", "")).strip()
+    code_ok = KR_CODE_REGEX.fullmatch
+    return [
+        item for item in items
+        if code_ok(str(item.get("code", "")).strip())
+        and not is_non_common_stock(str(item.get("name") or ""), str(item.get("companyClassName") or ""))
+    ]
 
-        if not KR_CODE_REGEX.fullmatch(code):
-            continue
 
-        if is_non_common_stock(name, company_class):
-            continue
+class TokenBucket:
+    """
+    비동기 토큰버킷 레이트리미터.
+    rate(초당 충전량)로 토큰을 채우고, 최대 capacity 까지 버스트 허용.
+    """
 
-        out.append(item)
-    return out
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
 
 
 class KiwoomAPI:
@@ -123,14 +177,47 @@ class KiwoomAPI:
             raise RuntimeError("KIWOOM_HOST is not set. Check .env loading.")
         self.token_store = token_store
 
+        # 엔드포인트 URL 은 한 번만 조립
+        self._urls = {
+            ep: self.host + ep
+            for ep in (ENDPOINT_TOKEN, ENDPOINT_REVOKE, ENDPOINT_CHART, ENDPOINT_STKINFO, ENDPOINT_MRKCOND)
+        }
+        # 프로세스 내 ka10001 캐시 (같은 실행 중 중복 조회 방지)
+        self._basic_cache: Dict[str, dict] = {}
+        # 비동기 경로에서 조회한 ka10001 결과 → Redis 일괄 저장 대기분 {key: basic}
+        self._basic_pending: Dict[str, dict] = {}
+        # 프로세스 내 접근토큰 캐시 (요청마다 Redis 조회 방지)
+        self._token_cache: Optional[str] = None
+        self._token_exp = 0.0
+
+        # 커넥션 재사용(keep-alive): 매 요청마다 TCP+TLS 핸드셰이크 방지
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+
+        # 비동기 수집용 api-id별 레이트리미터
+        self.buckets = {
+            api_id: TokenBucket(rate=TR_RATE_PER_SEC, capacity=TR_BURST)
+            for api_id in ("ka10086", "ka10001")
+        }
+        # 최근 응답의 429 여부(1/0) → 백오프 가중치
+        self._recent_429 = collections.deque(maxlen=RECENT_429_WINDOW)
+
+    def close(self):
+        try:
+            self.flush_ka10001_cache()
+        finally:
+            self.session.close()
+
     def fn_au10001(self, data: Dict[str, Any]) -> dict:
         """접근토큰 발급 + Redis 저장"""
-        url = self.host + ENDPOINT_TOKEN
+        url = self._urls[ENDPOINT_TOKEN]
         headers = {"Content-Type": "application/json;charset=UTF-8"}
 
-        r = requests.post(url, headers=headers, json=data, timeout=10)
+        r = self.session.post(url, headers=headers, data=orjson.dumps(data), timeout=10)
         r.raise_for_status()
-        body = r.json()
+        body = orjson.loads(r.content)
 
         token = body.get("token")
         expires_dt = body.get("expires_dt")
@@ -146,21 +233,25 @@ class KiwoomAPI:
 
     def fn_au10002(self, data: Dict[str, Any]) -> dict:
         """접근토큰 폐기"""
-        url = self.host + ENDPOINT_REVOKE
+        url = self._urls[ENDPOINT_REVOKE]
         headers = {"Content-Type": "application/json;charset=UTF-8"}
 
-        r = requests.post(url, headers=headers, json=data, timeout=10)
+        r = self.session.post(url, headers=headers, data=orjson.dumps(data), timeout=10)
+        self._invalidate_token()
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     def get_access_token(self) -> str:
         """
-        Redis에 토큰이 있으면 재사용.
+        프로세스 내 캐시 → Redis 순으로 재사용.
         없으면 au10001로 발급 후 Redis 저장.
         """
+        if self._token_cache and time.time() < self._token_exp - TOKEN_LOCAL_MARGIN:
+            return self._token_cache
+
         cached = self.token_store.get_token()
         if cached and cached.get("token"):
-            return cached["token"]
+            return self._remember_token(cached)
 
         params = {
             "grant_type": "client_credentials",
@@ -172,7 +263,71 @@ class KiwoomAPI:
         cached = self.token_store.get_token()
         if not cached or not cached.get("token"):
             raise RuntimeError("Token issuance succeeded but token not found in Redis.")
-        return cached["token"]
+        return self._remember_token(cached)
+
+    def _invalidate_token(self):
+        """
+        폐기/거절된 토큰을 프로세스 내 캐시와 Redis 에서 모두 제거.
+        다음 호출은 au10001 로 재발급.
+        """
+        self._token_cache = None
+        self._token_exp = 0.0
+        self.token_store.delete_token()
+
+    def _remember_token(self, cached: dict) -> str:
+        ttl = cached.get("ttl") or 0
+        self._token_cache = cached["token"]
+        self._token_exp = time.time() + ttl if ttl > 0 else 0.0
+        return self._token_cache
+
+    def _tr_headers(self, api_id: str, cont_yn: str, next_key: str) -> Dict[str, str]:
+        token = self.get_access_token()
+        return {
+            "Content-Type": "application/json;charset=UTF-8",
+            "authorization": f"Bearer {token}",
+            "cont-yn": cont_yn,
+            "next-key": next_key,
+            "api-id": api_id,
+        }
+
+    @staticmethod
+    def _parse_retry_after(ra: Optional[str]) -> Optional[float]:
+        """Retry-After: 초(delta-seconds) 또는 HTTP-date → [0, MAX_RETRY_AFTER] 로 제한"""
+        if not ra:
+            return None
+        try:
+            sec = float(ra)
+        except ValueError:
+            try:
+                dt = parsedate_to_datetime(ra)
+            except (TypeError, ValueError):
+                return None
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            sec = (dt - datetime.now(timezone.utc)).total_seconds()
+        if not math.isfinite(sec):
+            return None
+        return min(MAX_RETRY_AFTER, max(0.0, sec))
+
+    def _record_status(self, status_code: int):
+        self._recent_429.append(1 if status_code == 429 else 0)
+
+    def _retry_sleep(self, api_id: str, status_code: int, resp_headers: Any, attempt: int) -> float:
+        """
+        레이트리밋/일시 오류 시 대기 시간(초).
+        - Retry-After 가 있으면 우선
+        - 없으면 지수 백오프 + 지터: BASE_SLEEP * 2^attempt * (1 + [0, 0.5))
+        - 최근 429 비율(p429)이 높을수록 (1 + 4*p429) 배로 늘림
+        """
+        sleep_s = self._parse_retry_after(resp_headers.get("Retry-After"))
+        if sleep_s is None:
+            sleep_s = min(MAX_SLEEP, BASE_SLEEP * (2 ** attempt) * (1 + random.random() * 0.5))
+            if self._recent_429:
+                p429 = sum(self._recent_429) / len(self._recent_429)
+                sleep_s = min(MAX_SLEEP, sleep_s * (1 + 4 * p429))
+
+        print(f"[KIWOOM][RETRY] api_id={api_id} status={status_code} attempt={attempt + 1} sleep_s={sleep_s:.2f}")
+        return sleep_s
 
     def _post_tr(
             self,
@@ -182,39 +337,95 @@ class KiwoomAPI:
             cont_yn: str = "N",
             next_key: str = "",
     ) -> Tuple[Dict[str, Any], Dict[str, str]]:
-        token = self.get_access_token()
+        """응답 body + 헤더 (연속조회 cont-yn/next-key 등 헤더가 필요한 경우)"""
+        r = self._request_tr(api_id, endpoint, payload, cont_yn, next_key)
+        return orjson.loads(r.content), dict(r.headers)
 
-        url = self.host + endpoint
-        headers = {
-            "Content-Type": "application/json;charset=UTF-8",
-            "authorization": f"Bearer {token}",
-            "cont-yn": cont_yn,
-            "next-key": next_key,
-            "api-id": api_id,
-        }
+    def _post_tr_body(
+            self,
+            api_id: str,
+            endpoint: str,
+            payload: Dict[str, Any],
+            cont_yn: str = "N",
+            next_key: str = "",
+    ) -> Dict[str, Any]:
+        """응답 body 만 (헤더 dict 복사 생략)"""
+        return orjson.loads(self._request_tr(api_id, endpoint, payload, cont_yn, next_key).content)
+
+    def _request_tr(
+            self,
+            api_id: str,
+            endpoint: str,
+            payload: Dict[str, Any],
+            cont_yn: str,
+            next_key: str,
+    ) -> requests.Response:
+        url = self._urls[endpoint]
+        headers = self._tr_headers(api_id, cont_yn, next_key)
 
-        backoff = BASE_SLEEP
-        for attempt in range(1, MAX_RETRIES + 1):
-            r = requests.post(url, headers=headers, json=payload, timeout=20)
+        for attempt in range(MAX_RETRIES):
+            r = self.session.post(url, headers=headers, data=orjson.dumps(payload), timeout=20)
+            self._record_status(r.status_code)
 
             if r.status_code == 200:
-                return r.json(), dict(r.headers)
+                return r
 
             # 레이트리밋/일시 오류 대응
-            if r.status_code in (429, 500, 502, 503, 504):
-                ra = r.headers.get("Retry-After")
-                if ra:
-                    try:
-                        sleep_s = float(ra)
-                    except ValueError:
-                        sleep_s = backoff
-                else:
-                    sleep_s = min(MAX_SLEEP, backoff) + random.uniform(0, 0.3)
-
-                time.sleep(sleep_s)
-                backoff = min(MAX_SLEEP, backoff * 2)
+            if r.status_code in RETRY_STATUS:
+                time.sleep(self._retry_sleep(api_id, r.status_code, r.headers, attempt))
                 continue
 
+            if r.status_code in AUTH_FAIL_STATUS:
+                self._invalidate_token()
+
+            raise RuntimeError(f"[{api_id}] HTTP {r.status_code} body={r.text[:800]}")
+
+        raise RuntimeError(f"[{api_id}] retry exhausted")
+
+    async def _post_tr_body_async(
+            self,
+            client: httpx.AsyncClient,
+            api_id: str,
+            endpoint: str,
+            payload: Dict[str, Any],
+            cont_yn: str = "N",
+            next_key: str = "",
+    ) -> Dict[str, Any]:
+        """_post_tr_body 의 비동기 버전"""
+        r = await self._request_tr_async(client, api_id, endpoint, payload, cont_yn, next_key)
+        return orjson.loads(r.content)
+
+    async def _request_tr_async(
+            self,
+            client: httpx.AsyncClient,
+            api_id: str,
+            endpoint: str,
+            payload: Dict[str, Any],
+            cont_yn: str,
+            next_key: str,
+    ) -> httpx.Response:
+        """_request_tr 의 비동기 버전 (재시도 정책 동일)"""
+        url = self._urls[endpoint]
+        headers = self._tr_headers(api_id, cont_yn, next_key)
+
+        bucket = self.buckets.get(api_id)
+
+        for attempt in range(MAX_RETRIES):
+            if bucket is not None:
+                await bucket.acquire()
+            r = await client.post(url, headers=headers, content=orjson.dumps(payload))
+            self._record_status(r.status_code)
+
+            if r.status_code == 200:
+                return r
+
+            if r.status_code in RETRY_STATUS:
+                await asyncio.sleep(self._retry_sleep(api_id, r.status_code, r.headers, attempt))
+                continue
+
+            if r.status_code in AUTH_FAIL_STATUS:
+                self._invalidate_token()
+
             raise RuntimeError(f"[{api_id}] HTTP {r.status_code} body={r.text[:800]}")
 
         raise RuntimeError(f"[{api_id}] retry exhausted")
@@ -228,19 +439,35 @@ class KiwoomAPI:
           - "0": 코스피
           - "10": 코스닥
         반환: 필터된 종목 리스트
+        캐시: Redis 6h (KIWOOM_STKLIST_NOCACHE=1 이면 우회)
         """
+        use_cache = os.getenv("KIWOOM_STKLIST_NOCACHE") != "1"
+        key = f"kiwoom:ka10099:{','.join(markets)}"
+        if use_cache:
+            cached = self.token_store.get_json(key)
+            if cached is not None:
+                return cached
+
         all_items: List[Dict[str, Any]] = []
+        complete = True  # 모든 시장이 비어있지 않은 list 를 반환했는지
 
         for mrkt in markets:
             payload = {"mrkt_tp": mrkt}
-            body, _ = self._post_tr(api_id="ka10099", endpoint=ENDPOINT_STKINFO, payload=payload)
+            body = self._post_tr_body(api_id="ka10099", endpoint=ENDPOINT_STKINFO, payload=payload)
             lst = body.get("list") or []
-            if isinstance(lst, list):
+            if isinstance(lst, list) and lst:
                 all_items.extend(lst)
+            else:
+                complete = False
+                print(f"[KIWOOM][WARN] ka10099 mrkt_tp={mrkt} empty list (not cached)")
 
             time.sleep(SUCCESS_SLEEP_SEC)
 
-        return filter_stock_list(all_items)
+        result = filter_stock_list(all_items)
+        # 일부 시장이 빠진 리스트는 6h 동안 재사용되지 않도록 캐시 제외
+        if use_cache and complete and result:
+            self.token_store.set_json(key, result, ttl=STKLIST_CACHE_TTL)
+        return result
 
     # -------------------------
     # ka10086: 일별 주가(날짜 기준 1건)
@@ -264,7 +491,28 @@ class KiwoomAPI:
             "indc_tp": indc_tp,
         }
 
-        body, _ = self._post_tr(api_id="ka10086", endpoint=ENDPOINT_MRKCOND, payload=payload)
+        body = self._post_tr_body(api_id="ka10086", endpoint=ENDPOINT_MRKCOND, payload=payload)
+        rows = body.get("daly_stkpc") or []
+        if not rows:
+            return None
+
+        return rows[0]
+
+    async def fn_ka10086_daily_async(
+            self,
+            client: httpx.AsyncClient,
+            stk_cd: str,
+            qry_dt: str,
+            indc_tp: str = "0",
+    ) -> Optional[Dict[str, Any]]:
+        """fn_ka10086_daily 의 비동기 버전"""
+        payload = {
+            "stk_cd": stk_cd,
+            "qry_dt": qry_dt,
+            "indc_tp": indc_tp,
+        }
+
+        body = await self._post_tr_body_async(client, api_id="ka10086", endpoint=ENDPOINT_MRKCOND, payload=payload)
         rows = body.get("daly_stkpc") or []
         if not rows:
             return None
@@ -277,9 +525,10 @@ class KiwoomAPI:
     def fn_ka10081_latest(self, stk_cd: str, base_dt: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         ka10086 장애/제약 시 fallback 용도.
+        다건 호출 시 base_dt 를 호출측에서 한 번 계산해 넘길 것.
         """
         if base_dt is None:
-            base_dt = datetime.now(KST).strftime("%Y%m%d")
+            base_dt = _today_kst()
 
         payload = {
             "stk_cd": stk_cd,
@@ -287,7 +536,7 @@ class KiwoomAPI:
             "upd_stkpc_tp": "1",
         }
 
-        body, _ = self._post_tr(api_id="ka10081", endpoint=ENDPOINT_CHART, payload=payload)
+        body = self._post_tr_body(api_id="ka10081", endpoint=ENDPOINT_CHART, payload=payload)
         rows = body.get("stk_dt_pole_chart_qry") or []
         if not rows:
             return None
@@ -296,15 +545,101 @@ class KiwoomAPI:
     # -------------------------
     # ka10001: 기본정보(상장주식수/시총)
     # -------------------------
-    def fn_ka10001_basic(self, stk_cd: str) -> dict:
+    @staticmethod
+    def _ka10001_key(stk_cd: str, today_kst: str) -> str:
+        return f"kiwoom:ka10001:{stk_cd}:{today_kst}"
+
+    def prefetch_ka10001_basic(self, codes: List[str], today_kst: Optional[str] = None) -> Dict[str, dict]:
+        """오늘자 ka10001 캐시(프로세스 내 + Redis MGET 1회) 조회 → {code: basic}"""
+        result = {code: self._basic_cache[code] for code in codes if code in self._basic_cache}
+        missing = [code for code in codes if code not in result]
+
+        today_kst = today_kst or _today_kst()
+        keys = [self._ka10001_key(code, today_kst) for code in missing]
+        found = self.token_store.mget_json(keys)
+        for code, key in zip(missing, keys):
+            if key in found:
+                result[code] = self._basic_cache[code] = found[key]
+        return result
+
+    def fn_ka10001_basic(self, stk_cd: str, check_cache: bool = True, today_kst: Optional[str] = None) -> dict:
         """
         ka10001 응답 기준 (단위 보정)
           - flo_stk: 천주 → 주
           - mac: 억원 → 원
+        캐시: 프로세스 내 dict → Redis 1d
+              (조회 성공 시 항상 저장, check_cache=False 면 Redis 조회만 생략)
+        today_kst: 캐시 키 날짜 (배치에서는 1회 계산해 전달, 없으면 현재 KST)
         """
+        if stk_cd in self._basic_cache:
+            return self._basic_cache[stk_cd]
+
+        key = self._ka10001_key(stk_cd, today_kst or _today_kst())
+        if check_cache:
+            cached = self.token_store.get_json(key)
+            if cached:
+                self._basic_cache[stk_cd] = cached
+                return cached
+
         payload = {"stk_cd": stk_cd}
-        body, _ = self._post_tr(api_id="ka10001", endpoint=ENDPOINT_STKINFO, payload=payload)
+        body = self._post_tr_body(api_id="ka10001", endpoint=ENDPOINT_STKINFO, payload=payload)
+        result = self._parse_ka10001(body)
+        if self._ka10001_cacheable(body, result):
+            self._basic_cache[stk_cd] = result
+            self.token_store.set_json(key, result, ttl=BASIC_CACHE_TTL)
+        return result
+
+    def flush_ka10001_cache(self):
+        """
+        비동기 경로에서 쌓인 ka10001 결과를 파이프라인 1회로 Redis 저장.
+        캐시 저장은 best-effort: Redis 오류는 로그만 남기고 대기분은 버림 (수집은 계속).
+        """
+        pending, self._basic_pending = self._basic_pending, {}
+        if not pending:
+            return
+        try:
+            self.token_store.mset_json(pending, ttl=BASIC_CACHE_TTL)
+        except Exception as e:
+            print(f"[KIWOOM][WARN] ka10001 cache flush failed (dropped={len(pending)}) {e}")
+
+    async def fn_ka10001_basic_async(
+            self,
+            client: httpx.AsyncClient,
+            stk_cd: str,
+            check_cache: bool = True,
+            today_kst: Optional[str] = None,
+    ) -> dict:
+        """
+        fn_ka10001_basic 의 비동기 버전.
+        Redis 저장은 이벤트 루프를 막지 않도록 모아 두었다가 flush_ka10001_cache() 에서 일괄 처리.
+        """
+        if stk_cd in self._basic_cache:
+            return self._basic_cache[stk_cd]
 
+        key = self._ka10001_key(stk_cd, today_kst or _today_kst())
+        if check_cache:
+            cached = await asyncio.to_thread(self.token_store.get_json, key)
+            if cached:
+                self._basic_cache[stk_cd] = cached
+                return cached
+
+        payload = {"stk_cd": stk_cd}
+        body = await self._post_tr_body_async(client, api_id="ka10001", endpoint=ENDPOINT_STKINFO, payload=payload)
+        result = self._parse_ka10001(body)
+        if self._ka10001_cacheable(body, result):
+            self._basic_cache[stk_cd] = result
+            self._basic_pending[key] = result
+        return result
+
+    @staticmethod
+    def _ka10001_cacheable(body: Dict[str, Any], result: dict) -> bool:
+        """오류 응답/필드 누락(0 값)은 하루 동안 재사용되지 않도록 캐시 제외"""
+        if _normalize_int(body.get("return_code")) != 0:
+            return False
+        return bool(result["listed_shares"] and result["market_cap"])
+
+    @staticmethod
+    def _parse_ka10001(body: Dict[str, Any]) -> dict:
         flo_stk_raw = _normalize_int(body.get("flo_stk"))  # 천주
         mac_raw = _normalize_int(body.get("mac"))  # 억원
 
@@ -320,13 +655,29 @@ class KiwoomAPI:
     # -------------------------
     # 배치 스냅샷 생성
     # -------------------------
+    @staticmethod
+    def _build_row(code: str, qry_date: date, daily: Dict[str, Any], basic: Dict[str, Any]) -> Tuple[Any, ...]:
+        """DB 컬럼 순서 tuple: (code, ymd, open, high, low, close, volume, market_cap, listed_shares, name)"""
+        return (
+            code,
+            qry_date,  # 수집 시작 시 1회 파싱한 date (writer 에서 재파싱 없음)
+            abs(_normalize_int(daily.get("open_pric"))),
+            abs(_normalize_int(daily.get("high_pric"))),
+            abs(_normalize_int(daily.get("low_pric"))),
+            abs(_normalize_int(daily.get("close_pric"))),
+            abs(_normalize_int(daily.get("trde_qty"))),
+            int(basic["market_cap"]),
+            int(basic["listed_shares"]),
+            basic.get("stk_nm") or "",
+        )
+
     def collect_today_snapshot(
             self,
             markets: Tuple[str, ...] = ("0", "10"),
             qry_dt: Optional[str] = None,
             indc_tp: str = "0",
             per_code_sleep: float = 0.12,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Tuple[Any, ...]]:
         """
         최종 산출:
           - 종목필터된 code에 대해
@@ -334,21 +685,25 @@ class KiwoomAPI:
           - ka10001 (flo_stk, mac)
           - 병합한 row 리스트를 반환 (DB 저장은 외부에서)
 
-        반환 row:
-          {
-            code, dt(=qry_dt),
+        반환 row (DB 컬럼 순서 tuple):
+          (
+            code, ymd(=qry_dt 의 date),
             open, high, low, close, volume,
-            listed_shares, market_cap, name
-          }
+            market_cap, listed_shares, name
+          )
         """
-        if qry_dt is None:
-            qry_dt = datetime.now(KST).strftime("%Y%m%d")
+        qry_dt = qry_dt or _today_kst()
+        qry_date = datetime.strptime(qry_dt, "%Y%m%d").date()
+        today_kst = _today_kst()  # ka10001 캐시 키 날짜 (실행 중 자정을 넘어도 고정)
 
         stocks = self.fn_ka10099_stock_list(markets=markets)
         codes = [s["code"] for s in stocks]
         print(f"[KIWOOM] filtered codes={len(codes)} qry_dt={qry_dt}")
 
-        out: List[Dict[str, Any]] = []
+        basic_cache = self.prefetch_ka10001_basic(codes, today_kst=today_kst)
+        print(f"[KIWOOM] ka10001 cache hit={len(basic_cache)}/{len(codes)}")
+
+        out: List[Tuple[Any, ...]] = []
 
         for idx, code in enumerate(codes, 1):
             try:
@@ -356,20 +711,9 @@ class KiwoomAPI:
                 if not daily:
                     continue
 
-                basic = self.fn_ka10001_basic(code)
-
-                row = {
-                    "code": code,
-                    "dt": qry_dt,  # YYYYMMDD (DB에서 date로 변환)
-                    "open": abs(_normalize_int(daily.get("open_pric"))),
-                    "high": abs(_normalize_int(daily.get("high_pric"))),
-                    "low": abs(_normalize_int(daily.get("low_pric"))),
-                    "close": abs(_normalize_int(daily.get("close_pric"))),
-                    "volume": abs(_normalize_int(daily.get("trde_qty"))),
-                    "listed_shares": int(basic["listed_shares"]),
-                    "market_cap": int(basic["market_cap"]),
-                    "name": basic.get("stk_nm") or "",
-                }
+                basic = basic_cache.get(code) or self.fn_ka10001_basic(code, check_cache=False, today_kst=today_kst)
+
+                row = self._build_row(code, qry_date, daily, basic)
                 out.append(row)
 
                 if idx % 100 == 0:
@@ -381,3 +725,102 @@ class KiwoomAPI:
             time.sleep(per_code_sleep)
 
         return out
+
+    async def collect_today_snapshot_async(
+            self,
+            markets: Tuple[str, ...] = ("0", "10"),
+            qry_dt: Optional[str] = None,
+            indc_tp: str = "0",
+            concurrency: int = ASYNC_CONCURRENCY,
+            batch_size: int = ASYNC_BATCH_SIZE,
+    ) -> AsyncIterator[List[Tuple[Any, ...]]]:
+        """
+        collect_today_snapshot 의 비동기 버전.
+        종목별 ka10086 + ka10001 호출을 최대 concurrency 개 종목까지 동시에 수행.
+        요청 속도는 api-id별 TokenBucket 으로 제한 (고정 sleep 없음).
+        row 형식은 동일하며, 완료 순으로 batch_size 개씩 묶어 yield (마지막은 잔여분).
+        """
+        qry_dt = qry_dt or _today_kst()
+        qry_date = datetime.strptime(qry_dt, "%Y%m%d").date()
+        today_kst = _today_kst()  # ka10001 캐시 키 날짜 (실행 중 자정을 넘어도 고정)
+
+        stocks = self.fn_ka10099_stock_list(markets=markets)
+        codes = [s["code"] for s in stocks]
+        print(f"[KIWOOM] filtered codes={len(codes)} qry_dt={qry_dt} concurrency={concurrency}")
+
+        basic_cache = self.prefetch_ka10001_basic(codes, today_kst=today_kst)
+        print(f"[KIWOOM] ka10001 cache hit={len(basic_cache)}/{len(codes)}")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        sem = asyncio.Semaphore(concurrency)
+        done = 0
+        collected = 0
+
+        limits = httpx.Limits(
+            max_connections=ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=ASYNC_MAX_KEEPALIVE,
+        )
+        # HTTP/2: 동시 요청을 TLS 커넥션 1개에 멀티플렉싱 (서버 미지원 시 ALPN 으로 HTTP/1.1 협상)
+        http2 = os.getenv("KIWOOM_HTTP2", "1") != "0"
+        async with httpx.AsyncClient(http2=http2, limits=limits, timeout=20) as client:
+
+            async def _collect_one(code: str):
+                nonlocal done, collected
+                async with sem:
+                    try:
+                        basic = basic_cache.get(code)
+                        if basic:
+                            daily = await self.fn_ka10086_daily_async(client, code, qry_dt=qry_dt, indc_tp=indc_tp)
+                        else:
+                            # 캐시 미스: ka10086/ka10001 은 서로 독립이므로 동시에 요청
+                            daily, basic = await asyncio.gather(
+                                self.fn_ka10086_daily_async(client, code, qry_dt=qry_dt, indc_tp=indc_tp),
+                                self.fn_ka10001_basic_async(client, code, check_cache=False, today_kst=today_kst),
+                                return_exceptions=True,
+                            )
+                            for res in (daily, basic):
+                                if isinstance(res, BaseException):
+                                    raise res
+
+                        if daily:
+                            queue.put_nowait(self._build_row(code, qry_date, daily, basic))
+                            collected += 1
+                    except Exception as e:
+                        print(f"[KIWOOM][ERROR] code={code} {e}")
+
+                    done += 1
+                    if done % 100 == 0:
+                        print(f"[KIWOOM] progress {done}/{len(codes)} collected={collected}")
+
+            async def _produce():
+                try:
+                    await asyncio.gather(*(_collect_one(code) for code in codes))
+                finally:
+                    queue.put_nowait(None)  # 종료 신호
+
+            producer = asyncio.create_task(_produce())
+            try:
+                batch: List[Tuple[Any, ...]] = []
+                while True:
+                    row = await queue.get()
+                    if row is None:
+                        break
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        self.flush_ka10001_cache()  # 배치당 Redis 1회
+                        yield batch
+                        batch = []
+
+                if batch:
+                    self.flush_ka10001_cache()
+                    yield batch
+                await producer
+            finally:
+                if not producer.done():
+                    # 클라이언트 종료 전에 진행 중인 요청이 모두 취소 완료되도록 대기
+                    producer.cancel()
+                    try:
+                        await producer
+                    except asyncio.CancelledError:
+                        pass
+                self.flush_ka10001_cache()
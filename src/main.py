@@ -1,6 +1,9 @@
 from pathlib import Path
 from dotenv import load_dotenv
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
@@ -10,33 +13,51 @@ from kiwoom import KiwoomAPI
 from pg_writer import PostgresWriter
 
 
-def run():
-    t0 = time.perf_counter()
+async def collect_and_upsert(api: KiwoomAPI, writer: PostgresWriter, executor: ThreadPoolExecutor) -> Tuple[int, int]:
+    """
+    수집(producer) 과 업서트(consumer) 를 병행.
+    수집기가 yield 하는 배치를 즉시 스레드풀에서 upsert.
+    반환: (collected rows, upserted rows)
+    """
+    loop = asyncio.get_running_loop()
+    futures = []
+    collected = 0
 
-    # 1) 수집
-    t_collect_0 = time.perf_counter()
-    api = KiwoomAPI(RedisTokenStore())
-    rows = api.collect_today_snapshot(
+    async for batch in api.collect_today_snapshot_async(
         markets=("0", "10"),
         qry_dt=None,      # None이면 오늘
         indc_tp="0",
-        per_code_sleep=0.12,
-    )
-    t_collect_1 = time.perf_counter()
-
-    collect_sec = t_collect_1 - t_collect_0
-    print(f"[MAIN] collected rows={len(rows)}  time={collect_sec:.2f}s"
-          + (f"  ({len(rows)/collect_sec:.2f} rows/s)" if collect_sec > 0 and rows else ""))
-
-    # 2) 업서트
-    t_upsert_0 = time.perf_counter()
-    writer = PostgresWriter()
-    n = writer.upsert_kr_daily_price(rows, table="kr_daily_price")
-    t_upsert_1 = time.perf_counter()
-
-    upsert_sec = t_upsert_1 - t_upsert_0
-    print(f"[MAIN] upserted rows={n}  time={upsert_sec:.2f}s"
-          + (f"  ({n/upsert_sec:.2f} rows/s)" if upsert_sec > 0 and n else ""))
+    ):
+        collected += len(batch)
+        futures.append(loop.run_in_executor(executor, writer.upsert_kr_daily_price, batch, "kr_daily_price"))
+
+    counts = await asyncio.gather(*futures)
+    return collected, sum(counts)
+
+
+def run():
+    t0 = time.perf_counter()
+
+    api = KiwoomAPI(RedisTokenStore())
+    writer = None
+    executor = None
+    try:
+        writer = PostgresWriter()
+        # upsert 동시 실행 수는 PostgresWriter 커넥션 풀(maxconn=4) 이내로 제한
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        # 1) 수집 + 2) 업서트 (병행)
+        collected, n = asyncio.run(collect_and_upsert(api, writer, executor))
+        pipeline_sec = time.perf_counter() - t0
+
+        print(f"[MAIN] collected rows={collected}  upserted rows={n}  time={pipeline_sec:.2f}s"
+              + (f"  ({n/pipeline_sec:.2f} rows/s)" if pipeline_sec > 0 and n else ""))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        api.close()
+        if writer is not None:
+            writer.close()
 
     # 3) 전체
     total_sec = time.perf_counter() - t0
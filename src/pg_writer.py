@@ -1,7 +1,20 @@
+import io
 import os
-from typing import List, Dict, Any
-import psycopg2
-from psycopg2.extras import execute_values
+from typing import Any, Iterable, Tuple
+from psycopg2.pool import ThreadedConnectionPool
+
+
+COLUMNS = ("code", "ymd", "open", "high", "low", "close", "volume", "market_cap", "listed_shares", "name")
+
+
+def _copy_field(v: Any) -> str:
+    """COPY text 포맷 필드 인코딩 (NULL → \\N, 구분자/개행 이스케이프)"""
+    if v is None:
+        return "\\N"
+    s = v.isoformat() if hasattr(v, "isoformat") else str(v)
+    if "\\" in s or "\t" in s or "\n" in s or "\r" in s:
+        s = s.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    return s
 
 
 class PostgresWriter:
@@ -10,46 +23,34 @@ class PostgresWriter:
         if not dsn:
             raise RuntimeError("PG_DSN is not set in environment/.env")
         self.dsn = dsn
+        self.pool = ThreadedConnectionPool(minconn=1, maxconn=4, dsn=self.dsn)
 
-    def upsert_kr_daily_price(self, rows: List[Dict[str, Any]], table: str = "kr_daily_price") -> int:
+    def close(self):
+        self.pool.closeall()
+
+    def upsert_kr_daily_price(self, rows: Iterable[Tuple[Any, ...]], table: str = "kr_daily_price") -> int:
         """
-        rows format (from kiwoom.collect_today_snapshot()):
-          code, dt(YYYYMMDD), open, high, low, close, volume, market_cap, listed_shares, name(optional)
+        rows format (from kiwoom.collect_today_snapshot()), COLUMNS 순서 tuple:
+          code, ymd(date 또는 YYYYMMDD), open, high, low, close, volume, market_cap, listed_shares, name
         Upsert key: (code, ymd)
         """
-        if not rows:
+        buf = io.StringIO()
+        n = 0
+        for r in rows:
+            buf.write("\t".join(_copy_field(x) for x in r))
+            buf.write("\n")
+            n += 1
+        if not n:
             return 0
+        buf.seek(0)
 
-        values = []
-        for r in rows:
-            values.append((
-                r["code"],
-                r["dt"],
-                int(r["open"]),
-                int(r["high"]),
-                int(r["low"]),
-                int(r["close"]),
-                int(r["volume"]),
-                int(r.get("market_cap", 0)),
-                int(r.get("listed_shares", 0)),
-                r['name']
-            ))
+        cols = ", ".join(COLUMNS)
 
-        sql = f"""
+        # COPY → TEMP 스테이징 → INSERT ... SELECT 로 upsert
+        upsert_sql = f"""
         INSERT INTO {table}
-            (code, ymd, open, high, low, close, volume, market_cap, listed_shares, name)
-        SELECT
-            v.code,
-            to_date(v.dt, 'YYYYMMDD') AS ymd,
-            v.open,
-            v.high,
-            v.low,
-            v.close,
-            v.volume,
-            v.market_cap,
-            v.listed_shares,
-            v.name        
-        FROM (VALUES %s) AS v(code, dt, open, high, low, close, volume, market_cap, listed_shares, name)
+            ({cols})
+        SELECT {cols} FROM stg_daily_price
         ON CONFLICT (code, ymd) DO UPDATE SET
             open = EXCLUDED.open,
             high = EXCLUDED.high,
@@ -63,9 +64,17 @@ class PostgresWriter:
         ;
         """
 
-        with psycopg2.connect(self.dsn) as conn:
+        conn = self.pool.getconn()
+        try:
             with conn.cursor() as cur:
-                execute_values(cur, sql, values, page_size=1000)
+                cur.execute(f"CREATE TEMP TABLE stg_daily_price (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+                cur.copy_expert(f"COPY stg_daily_price ({cols}) FROM STDIN", buf)
+                cur.execute(upsert_sql)
             conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
 
-        return len(rows)
+        return n
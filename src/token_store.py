@@ -1,7 +1,7 @@
 import os
 import json
 import redis
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 class RedisTokenStore:
     def __init__(self):
@@ -19,7 +19,42 @@ class RedisTokenStore:
         self.r.set(self.key, payload, ex=max(60, ttl_seconds))
 
     def get_token(self) -> Optional[dict]:
-        raw = self.r.get(self.key)
+        """토큰 + 남은 TTL(초)을 파이프라인 1회로 조회"""
+        pipe = self.r.pipeline(transaction=False)
+        pipe.get(self.key)
+        pipe.ttl(self.key)
+        raw, ttl = pipe.execute()
+        if not raw:
+            return None
+        token = json.loads(raw)
+        token["ttl"] = ttl
+        return token
+
+    def delete_token(self):
+        self.r.delete(self.key)
+
+    # ---- 범용 JSON 캐시 ----
+    def get_json(self, key: str) -> Optional[Any]:
+        raw = self.r.get(key)
         if not raw:
             return None
         return json.loads(raw)
+
+    def set_json(self, key: str, obj: Any, ttl: int):
+        self.r.set(key, json.dumps(obj, ensure_ascii=False), ex=max(1, ttl))
+
+    def mget_json(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키를 MGET 1회로 조회. 존재하는 키만 반환."""
+        if not keys:
+            return {}
+        raws = self.r.mget(keys)
+        return {k: json.loads(raw) for k, raw in zip(keys, raws) if raw}
+
+    def mset_json(self, items: Dict[str, Any], ttl: int):
+        """여러 키를 SET ... EX 파이프라인 1회로 저장."""
+        if not items:
+            return
+        pipe = self.r.pipeline(transaction=False)
+        for key, obj in items.items():
+            pipe.set(key, json.dumps(obj, ensure_ascii=False), ex=max(1, ttl))
+        pipe.execute()